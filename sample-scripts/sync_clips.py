@@ -15,75 +15,268 @@ Features:
     - Folder naming: {date}_{title-slug}_{site-slug} (e.g., 20260121_my-article_github-com)
     - Content saved as {folder-name}.md (not content.md)
     - Preserves metadata in JSON sidecar files
-    - Incremental sync (skips existing clips)
+    - Incremental sync (skips existing clips without fetching them again)
+    - Concurrent downloads (many clips fetched in parallel)
+    - Retries with backoff when the server is throttling (HTTP 429/503)
 """
 
 import os
+import re
 import sys
 import json
+import asyncio
 import base64
+import shutil
 import argparse
-from urllib.request import Request, urlopen
+import functools
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen, getproxies, proxy_bypass
 from urllib.error import URLError, HTTPError
-from urllib.parse import urljoin, quote
+from urllib.parse import urljoin, quote, urlsplit
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+
+# Characters that are unsafe in filenames, mapped to underscores
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+# Spaces and underscores become hyphens in slugs
+_SLUG_DASH_TABLE = str.maketrans({' ': '-', '_': '-'})
+# Anything that isn't a lowercase letter, digit or hyphen
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9-]')
+# Runs of consecutive hyphens
+_SLUG_DASHES_RE = re.compile(r'-+')
+# datetime.fromisoformat() accepts a trailing 'Z' and any number of
+# fractional digits (Go's RFC3339Nano has up to 9) from Python 3.11
+_FROMISOFORMAT_ACCEPTS_RFC3339 = sys.version_info >= (3, 11)
+# Fractional seconds, normalised to the 6 digits older Pythons require
+_FRACTION_RE = re.compile(r'\.(\d+)')
+# Reused for every metadata sidecar (json.dumps with indent builds a new one per call)
+_METADATA_ENCODER = json.JSONEncoder(indent=2)
+
+
+class SyncAborted(Exception):
+    """Raised when the sync can't go on (bad token, server unreachable)."""
 
 
 class WebClipperSync:
     """Syncs clips from Web Clipper API to local filesystem."""
 
-    def __init__(self, api_url, token, output_dir):
+    # Default number of HTTP requests (and connections) in flight at once
+    MAX_CONCURRENT_REQUESTS = 16
+    # Maximum number of image downloads in flight at once, across all clips
+    MAX_CONCURRENT_IMAGES = 8
+    # Clips per list page (server maximum)
+    PER_PAGE = 100
+    # Redirect statuses followed for GET requests, and how many in a row
+    REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+    MAX_REDIRECTS = 5
+    # Statuses retried with exponential backoff (rate limited / overloaded)
+    RETRY_STATUSES = (429, 503)
+    MAX_RETRIES = 5
+    # First retry delay in seconds, doubled on each further attempt
+    RETRY_BACKOFF = 1.0
+    # Upper bound in seconds on a server-supplied Retry-After
+    MAX_RETRY_AFTER = 60
+    # Print a progress line every N processed clips
+    PROGRESS_EVERY = 25
+    # Threads writing clip files, so disk I/O overlaps with HTTP
+    DISK_WORKERS = 4
+    # Read size when streaming media downloads to disk
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, api_url, token, output_dir, concurrency=None):
         self.api_url = api_url.rstrip('/')
         self.token = token
+        # Request headers, built once and shared by every request
+        self._auth_headers = {'Authorization': f'Bearer {token}'}
+        self._json_headers = {**self._auth_headers, 'Content-Type': 'application/json'}
         self.output_dir = Path(output_dir)
+        self.concurrency = concurrency or self.MAX_CONCURRENT_REQUESTS
+        # Timestamp stamped into every clip's metadata, set once per sync
+        self._synced_at = None
+        # Names of existing clip folders per mode, built once per sync
+        self._existing = {}
+        # Clips handed to the workers, and how many of them are done
+        self._queued = 0
+        self._processed = 0
+        # Set once a SyncAborted is seen; workers then stop taking clips
+        self._aborted = False
         self.stats = {'downloaded': 0, 'skipped': 0, 'errors': 0}
+        # Blocking HTTP runs on these threads, each keeping one
+        # persistent (keep-alive) connection to the API server
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix='sync-http'
+        )
+        self._local = threading.local()
+        # Every connection opened by the threads, closed when the sync ends
+        self._connections = []
+        # Persistent connections can't go through a proxy; when one applies
+        # to the API host (HTTP_PROXY etc.) requests fall back to urlopen()
+        self._use_urlopen = self._api_uses_proxy()
+        self._disk_executor = ThreadPoolExecutor(
+            max_workers=self.DISK_WORKERS,
+            thread_name_prefix='sync-disk'
+        )
+        # Created in sync_all() so they belong to the running event loop
+        self._request_slots = None
+        self._image_slots = None
+
+    def _api_uses_proxy(self):
+        """Check whether a configured proxy applies to the API server."""
+        parsed = urlsplit(self.api_url)
+        if not getproxies().get(parsed.scheme):
+            return False
+        return not proxy_bypass(parsed.hostname or '')
+
+    def _connection(self):
+        """Return this thread's persistent connection to the API server."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            parsed = urlsplit(self.api_url)
+            if parsed.scheme == 'https':
+                conn = http.client.HTTPSConnection(parsed.netloc)
+            else:
+                conn = http.client.HTTPConnection(parsed.netloc)
+            self._local.conn = conn
+            self._connections.append(conn)
+        return conn
+
+    def _send(self, target, headers):
+        """Send a GET over the thread's connection and return the response."""
+        # The server may have closed an idle keep-alive connection, so a
+        # failed request is retried once on a fresh connection
+        for attempt in range(2):
+            conn = self._connection()
+            try:
+                conn.request('GET', target, headers=headers)
+                return conn.getresponse()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                if attempt == 1:
+                    raise URLError(e)
+
+    def _get(self, url, headers):
+        """Perform a blocking GET, reusing the thread's connection.
+
+        Behaves like urllib's urlopen(): redirects are followed, other
+        non-2xx statuses raise HTTPError and an unreachable server raises
+        URLError. Proxied requests and redirects to another server go
+        through urlopen() itself.
+        """
+        if self._use_urlopen:
+            return urlopen(Request(url, headers=headers))
+
+        api = urlsplit(self.api_url)
+        for _ in range(self.MAX_REDIRECTS + 1):
+            parsed = urlsplit(url)
+            if (parsed.scheme, parsed.netloc) != (api.scheme, api.netloc):
+                return urlopen(Request(url, headers=headers))
+
+            target = f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+            response = self._send(target, headers)
+            location = response.headers.get('Location')
+
+            # Drain the body of anything but a success so the connection
+            # can be reused
+            if response.status in self.REDIRECT_STATUSES and location:
+                response.read()
+                url = urljoin(url, location)
+                continue
+            if not 200 <= response.status < 300:
+                response.read()
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return response
+
+        response.read()
+        raise HTTPError(url, response.status, 'Too many redirects', response.headers, None)
+
+    async def _run_blocking(self, func, *args):
+        """Run blocking HTTP work on the connection threads."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _run_on_disk(self, func, *args):
+        """Run blocking filesystem work on the disk threads."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._disk_executor, func, *args)
+
+    def _retry_delay(self, error, attempt):
+        """Seconds to wait before retrying: Retry-After (capped) if given, else backoff."""
+        retry_after = error.headers.get('Retry-After') if error.headers else None
+        if retry_after and retry_after.isdigit():
+            return min(int(retry_after), self.MAX_RETRY_AFTER)
+        return self.RETRY_BACKOFF * 2 ** attempt
+
+    async def _request(self, func, *args):
+        """Run a blocking request, retrying when the server is throttling.
+
+        The backoff sleep happens outside the request slot so other
+        requests keep flowing meanwhile.
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self._request_slots:
+                    return await self._run_blocking(func, *args)
+            except HTTPError as e:
+                if e.code not in self.RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                    raise
+                delay = self._retry_delay(e, attempt)
+                print(f"⏳ Server returned HTTP {e.code}, retrying in {delay:g}s...", file=sys.stderr)
+            await asyncio.sleep(delay)
+
+    def _read_json(self, url, headers):
+        """Perform a blocking request and decode the JSON body."""
+        with self._get(url, headers) as response:
+            # json.loads detects UTF-8 in bytes, no separate decode step needed
+            return json.loads(response.read())
+
+    def _read_to_file(self, url, headers, output_path):
+        """Perform a blocking request and write the body to output_path."""
+        with self._get(url, headers) as response:
+            try:
+                with open(output_path, 'wb') as f:
+                    # Stream in chunks so large screenshots never sit fully in memory
+                    shutil.copyfileobj(response, f, self.DOWNLOAD_CHUNK_SIZE)
+            except Exception:
+                # Don't leave a truncated file behind
+                output_path.unlink(missing_ok=True)
+                raise
 
-    def _make_request(self, endpoint):
+    async def _make_request(self, endpoint):
         """Make authenticated API request."""
         url = urljoin(self.api_url, endpoint)
-        headers = {
-            'Authorization': f'Bearer {self.token}',
-            'Content-Type': 'application/json'
-        }
 
         try:
-            request = Request(url, headers=headers)
-            with urlopen(request) as response:
-                return json.loads(response.read().decode('utf-8'))
+            return await self._request(self._read_json, url, self._json_headers)
         except HTTPError as e:
             if e.code == 401:
-                print(f"❌ Authentication failed. Check your token.", file=sys.stderr)
-                sys.exit(1)
+                raise SyncAborted("Authentication failed. Check your token.") from e
             else:
                 print(f"❌ HTTP Error {e.code}: {e.reason}", file=sys.stderr)
                 raise
         except URLError as e:
-            print(f"❌ Failed to connect to {url}: {e.reason}", file=sys.stderr)
-            sys.exit(1)
+            raise SyncAborted(f"Failed to connect to {url}: {e.reason}") from e
 
-    def list_clips(self, page=1, per_page=100):
+    async def list_clips(self, page=1, per_page=100):
         """List all clips with pagination."""
         endpoint = f'/api/v1/clips?page={page}&per_page={per_page}'
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
 
-    def get_clip_detail(self, clip_id):
+    async def get_clip_detail(self, clip_id):
         """Get full clip details including content."""
         endpoint = f'/api/v1/clips/{clip_id}'
-        return self._make_request(endpoint)
+        return await self._make_request(endpoint)
 
-    def download_image(self, clip_id, filename, output_path):
+    async def download_image(self, clip_id, filename, output_path):
         """Download image file from clip media endpoint."""
         url = f"{self.api_url}/api/v1/clips/{clip_id}/media/{quote(filename)}"
-        headers = {
-            'Authorization': f'Bearer {self.token}',
-        }
 
         try:
-            request = Request(url, headers=headers)
-            with urlopen(request) as response:
-                output_path.write_bytes(response.read())
-                return True
+            await self._request(self._read_to_file, url, self._auth_headers, output_path)
+            return True
         except HTTPError as e:
             if e.code == 404:
                 print(f"⚠️  Image not found: {filename}", file=sys.stderr)
@@ -94,26 +287,36 @@ class WebClipperSync:
             print(f"❌ Failed to download {filename}: {e}", file=sys.stderr)
             return False
 
+    async def _fetch_media(self, clip_id, img_filename, media_dir):
+        """Download one media file of a clip and report the outcome."""
+        img_file = media_dir / img_filename
+
+        # Download actual image file from the media endpoint
+        async with self._image_slots:
+            downloaded = await self.download_image(clip_id, img_filename, img_file)
+
+        if downloaded:
+            print(f"   📷 Downloaded media: {img_filename}")
+        else:
+            print(f"   ⚠️  Failed to download media: {img_filename}")
+
     def sanitize_filename(self, filename):
         """Sanitize filename for filesystem."""
-        # Replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*'
-        for char in unsafe_chars:
-            filename = filename.replace(char, '_')
-        # Limit length
-        return filename[:200]
+        # Replace unsafe characters and limit length
+        return filename.translate(_SANITIZE_TABLE)[:200]
 
-    def slugify(self, text):
-        """Convert text to URL-friendly slug."""
-        import re
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def slugify(text):
+        """Convert text to URL-friendly slug (cached, many clips share a site)."""
         # Convert to lowercase
         slug = text.lower()
         # Replace spaces and underscores with hyphens
-        slug = slug.replace(' ', '-').replace('_', '-')
+        slug = slug.translate(_SLUG_DASH_TABLE)
         # Remove non-alphanumeric characters except hyphens
-        slug = re.sub(r'[^a-z0-9-]', '', slug)
+        slug = _SLUG_INVALID_RE.sub('', slug)
         # Replace multiple consecutive hyphens with single hyphen
-        slug = re.sub(r'-+', '-', slug)
+        slug = _SLUG_DASHES_RE.sub('-', slug)
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
         # Limit length
@@ -121,61 +324,119 @@ class WebClipperSync:
 
     def extract_site_slug(self, url):
         """Extract and slugify site name from URL."""
-        from urllib.parse import urlparse
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
             domain = parsed.netloc or parsed.path.split('/')[0]
-            # Remove www. prefix
-            domain = domain.replace('www.', '')
+            # Remove www. prefix (only at the start of the host)
+            if domain.startswith('www.'):
+                domain = domain[4:]
             # Slugify the domain
             return self.slugify(domain)
         except:
             return 'unknown-site'
 
-    def format_date(self, timestamp_str):
-        """Format ISO timestamp to YYYYMMDD."""
+    def parse_timestamp(self, timestamp_str):
+        """Parse ISO timestamp to an aware datetime (None if invalid)."""
         try:
             # Parse ISO format: 2026-01-21T12:34:56Z
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            return dt.strftime('%Y%m%d')
-        except:
+            if not _FROMISOFORMAT_ACCEPTS_RFC3339:
+                timestamp_str = timestamp_str.replace('Z', '+00:00')
+                timestamp_str = _FRACTION_RE.sub(
+                    lambda m: '.' + m.group(1).ljust(6, '0')[:6], timestamp_str
+                )
+            dt = datetime.fromisoformat(timestamp_str)
+        except (AttributeError, TypeError, ValueError):
+            return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+
+    def format_date(self, timestamp_str):
+        """Format ISO timestamp to YYYYMMDD."""
+        dt = self.parse_timestamp(timestamp_str)
+        if dt is None:
             # Fallback to today's date
             return datetime.utcnow().strftime('%Y%m%d')
+        return dt.strftime('%Y%m%d')
+
+    def _clip_dir_name(self, clip):
+        """Build the clip folder name: {date}_{title}_{site}."""
+        date_part = self.format_date(clip.get('created_at', ''))
+        title_part = self.slugify(clip.get('title', 'untitled'))
+        site_part = self.extract_site_slug(clip.get('url', ''))
+        return f"{date_part}_{title_part}_{site_part}"
+
+    def _scan_existing(self):
+        """Index existing clip folders with one scandir per mode directory."""
+        existing = {}
+        with os.scandir(self.output_dir) as modes:
+            for mode_entry in modes:
+                if mode_entry.is_dir():
+                    with os.scandir(mode_entry.path) as clips:
+                        existing[mode_entry.name] = {entry.name for entry in clips}
+        return existing
+
+    def _clip_exists(self, mode, clip_dir_name):
+        """Check the existing-folder index instead of stat()ing the disk."""
+        return clip_dir_name in self._existing.get(mode, ())
+
+    def _already_synced(self, clip_summary):
+        """Check whether a listed clip's folder already exists locally.
+
+        The list response carries every field the folder name is built
+        from, so this needs no detail request.
+        """
+        mode = clip_summary.get('mode', 'article')
+        return self._clip_exists(mode, self._clip_dir_name(clip_summary))
 
-    def save_clip(self, clip_detail):
+    def _write_files(self, files):
+        """Write a batch of (path, bytes) pairs to disk."""
+        for path, data in files:
+            path.write_bytes(data)
+
+    async def save_clip(self, clip_detail):
         """Save clip to local filesystem."""
         clip_id = clip_detail['id']
         mode = clip_detail.get('mode', 'article')
         title = clip_detail.get('title', 'untitled')
-        url = clip_detail.get('url', '')
-        created_at = clip_detail.get('created_at', '')
 
-        # Create mode subdirectory
+        # Create mode subdirectory, once per run (modes already on disk
+        # or created earlier are keys of the existing-folder index)
         mode_dir = self.output_dir / mode
-        mode_dir.mkdir(parents=True, exist_ok=True)
+        if mode not in self._existing:
+            mode_dir.mkdir(parents=True, exist_ok=True)
+            self._existing[mode] = set()
 
         # Create clip directory with format: {date}_{title}_{site}
-        date_part = self.format_date(created_at)
-        title_part = self.slugify(title)
-        site_part = self.extract_site_slug(url)
-        clip_dir_name = f"{date_part}_{title_part}_{site_part}"
+        clip_dir_name = self._clip_dir_name(clip_detail)
         clip_dir = mode_dir / clip_dir_name
 
         # Skip if already exists
-        if clip_dir.exists():
+        if self._clip_exists(mode, clip_dir_name):
             print(f"⏭️  Skipping {title} (already synced)")
             self.stats['skipped'] += 1
             return
 
-        clip_dir.mkdir(parents=True, exist_ok=True)
+        # Record it right away so duplicates later in this run are skipped
+        self._existing[mode].add(clip_dir_name)
+
+        # Everything is written to a staging folder that is renamed into
+        # place once complete, so an interrupted sync never leaves a
+        # half-written clip folder that later runs would skip
+        staging_name = f'{clip_dir_name}.tmp'
+        staging_dir = mode_dir / staging_name
 
         try:
-            # Save main content to {folder_name}.md instead of content.md
+            if staging_name in self._existing[mode]:
+                # Left over from an interrupted run
+                await self._run_on_disk(functools.partial(shutil.rmtree, staging_dir, ignore_errors=True))
+            staging_dir.mkdir()
+
+            # Main content goes to {folder_name}.md instead of content.md
             content = clip_detail.get('content', '')
-            content_file = clip_dir / f'{clip_dir_name}.md'
-            content_file.write_text(content, encoding='utf-8')
+            content_file = staging_dir / f'{clip_dir_name}.md'
 
-            # Save metadata
+            # Metadata sidecar
             metadata = {
                 'id': clip_detail['id'],
                 'title': clip_detail['title'],
@@ -184,39 +445,93 @@ class WebClipperSync:
                 'tags': clip_detail.get('tags', []),
                 'notes': clip_detail.get('notes', ''),
                 'created_at': clip_detail['created_at'],
-                'synced_at': datetime.utcnow().isoformat() + 'Z'
+                'synced_at': self._synced_at
             }
-            metadata_file = clip_dir / 'metadata.json'
-            metadata_file.write_text(json.dumps(metadata, indent=2), encoding='utf-8')
+            metadata_file = staging_dir / 'metadata.json'
+
+            # Encode everything up front and write the files in one batch
+            await self._run_on_disk(self._write_files, [
+                (content_file, content.encode('utf-8')),
+                (metadata_file, _METADATA_ENCODER.encode(metadata).encode('utf-8')),
+            ])
 
             # Download images if present
             images = clip_detail.get('images', [])
             if images:
-                media_dir = clip_dir / 'media'
+                media_dir = staging_dir / 'media'
                 media_dir.mkdir(exist_ok=True)
 
-                for img in images:
-                    img_filename = img.get('filename', 'image.png')
-                    img_file = media_dir / img_filename
-
-                    # Download actual image file from the media endpoint
-                    if self.download_image(clip_id, img_filename, img_file):
-                        print(f"   📷 Downloaded media: {img_filename}")
-                    else:
-                        print(f"   ⚠️  Failed to download media: {img_filename}")
+                # Images are independent, so download them all at once
+                await asyncio.gather(*(
+                    self._fetch_media(clip_id, img.get('filename', 'image.png'), media_dir)
+                    for img in images
+                ))
 
+            await self._run_on_disk(os.rename, staging_dir, clip_dir)
             print(f"✅ Synced: {title}")
             self.stats['downloaded'] += 1
 
         except Exception as e:
             print(f"❌ Error saving {title}: {e}", file=sys.stderr)
             self.stats['errors'] += 1
-            # Clean up partial directory
-            if clip_dir.exists():
-                import shutil
-                shutil.rmtree(clip_dir)
-
-    def sync_all(self):
+            # Clean up partial staging directory
+            await self._run_on_disk(functools.partial(shutil.rmtree, staging_dir, ignore_errors=True))
+            self._existing[mode].discard(clip_dir_name)
+
+    def _abort(self, error):
+        """Report the first fatal error and stop handing out clips."""
+        if not self._aborted:
+            print(f"❌ {error}", file=sys.stderr)
+            self._aborted = True
+
+    async def _enqueue_page(self, queue, page):
+        """List one page of clips and queue them for the workers."""
+        if self._aborted:
+            return {}
+        print(f"📥 Fetching page {page}...")
+        try:
+            response = await self.list_clips(page=page, per_page=self.PER_PAGE)
+        except SyncAborted as e:
+            self._abort(e)
+            return {}
+        except HTTPError:
+            # Already reported by _make_request
+            self.stats['errors'] += 1
+            return {}
+        for clip_summary in response.get('clips', []):
+            # Skip the detail request for clips that are already saved
+            if self._already_synced(clip_summary):
+                print(f"⏭️  Skipping {clip_summary.get('title', 'untitled')} (already synced)")
+                self.stats['skipped'] += 1
+                continue
+
+            queue.put_nowait(clip_summary)
+            self._queued += 1
+        return response
+
+    async def _clip_worker(self, queue):
+        """Fetch and save queued clips until cancelled."""
+        while True:
+            clip_summary = await queue.get()
+            if self._aborted:
+                # Drain the rest of the queue without fetching anything
+                queue.task_done()
+                continue
+            try:
+                clip_detail = await self.get_clip_detail(clip_summary['id'])
+                await self.save_clip(clip_detail)
+            except SyncAborted as e:
+                self._abort(e)
+            except Exception as e:
+                print(f"❌ Failed to fetch clip {clip_summary['id']}: {e}", file=sys.stderr)
+                self.stats['errors'] += 1
+            finally:
+                queue.task_done()
+                self._processed += 1
+                if self._processed % self.PROGRESS_EVERY == 0:
+                    print(f"📈 Progress: {self._processed}/{self._queued} clips processed")
+
+    async def sync_all(self):
         """Sync all clips from the API."""
         print(f"🔄 Starting sync from {self.api_url}")
         print(f"📁 Output directory: {self.output_dir.absolute()}")
@@ -224,33 +539,49 @@ class WebClipperSync:
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._synced_at = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        self._request_slots = asyncio.Semaphore(self.concurrency)
+        self._image_slots = asyncio.Semaphore(self.MAX_CONCURRENT_IMAGES)
+        self._existing = self._scan_existing()
+
+        # Workers fetch and save clips as soon as their page is listed
+        queue = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._clip_worker(queue))
+            for _ in range(self.concurrency)
+        ]
 
-        # Fetch all clips with pagination
-        page = 1
-        total_clips = 0
-
-        while True:
-            print(f"📥 Fetching page {page}...")
-            response = self.list_clips(page=page, per_page=100)
-
+        try:
+            # The first page tells us how many pages to fetch; the rest are
+            # listed concurrently while details for page 1 are in flight
+            response = await self._enqueue_page(queue, 1)
             clips = response.get('clips', [])
-            if not clips:
-                break
-
-            total_clips += len(clips)
-
-            # Fetch details and save each clip
-            for clip_summary in clips:
-                clip_id = clip_summary['id']
-                clip_detail = self.get_clip_detail(clip_id)
-                self.save_clip(clip_detail)
-
-            # Check if there are more pages
-            total_pages = response.get('total_pages', 1)
-            if page >= total_pages:
-                break
-
-            page += 1
+            total_clips = len(clips)
+            total_pages = response.get('total_pages', 1) if clips else 1
+
+            for next_page in asyncio.as_completed([
+                self._enqueue_page(queue, page) for page in range(2, total_pages + 1)
+            ]):
+                response = await next_page
+                total_clips += len(response.get('clips', []))
+
+            # Clips already in flight finish (and clean up after
+            # themselves) even when the sync was aborted
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            # All requests are done; stop the threads and drop the connections
+            self._executor.shutdown()
+            for conn in self._connections:
+                conn.close()
+            # Staging cleanup of aborted clips ran in the workers above
+            self._disk_executor.shutdown()
+
+        if self._aborted:
+            sys.exit(1)
 
         # Print summary
         print()
@@ -267,6 +598,17 @@ class WebClipperSync:
             sys.exit(1)
 
 
+def positive_int(value):
+    """argparse type for options that need a number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Sync clips from Web Clipper API to local folder',
@@ -285,6 +627,9 @@ Examples:
 
   # Specify token via argument
   python3 sync_clips.py --token wc_your_token_here
+
+  # Use more parallel connections on a high-latency link
+  python3 sync_clips.py --concurrency 32
         """
     )
 
@@ -306,6 +651,13 @@ Examples:
         help='Output directory for synced clips (default: ./clips)'
     )
 
+    parser.add_argument(
+        '--concurrency',
+        type=positive_int,
+        default=WebClipperSync.MAX_CONCURRENT_REQUESTS,
+        help='Number of parallel requests and connections (default: 16)'
+    )
+
     args = parser.parse_args()
 
     # Validate token
@@ -326,8 +678,8 @@ Examples:
         print("⚠️  Warning: Token should start with 'wc_'", file=sys.stderr)
 
     # Run sync
-    syncer = WebClipperSync(args.url, args.token, args.output)
-    syncer.sync_all()
+    syncer = WebClipperSync(args.url, args.token, args.output, args.concurrency)
+    asyncio.run(syncer.sync_all())
 
 
 if __name__ == '__main__':